@@ -12,7 +12,38 @@ for analysis of simulation experiments only.
 
 from __future__ import annotations
 
-from typing import TypedDict
+import sys
+import bisect
+import functools
+from typing import Final, Tuple, Iterable, TypedDict, NamedTuple
+from dataclasses import dataclass
+
+_DISCLAIMER: Final[str] = (
+    "DISCLAIMER: This summary is generated from classical computational inference. "
+    "It does NOT represent physical retrocausality or actual backward time propagation. "
+    "All analysis is performed using standard forward-time simulation with post-hoc "
+    "constraint evaluation. Results should be interpreted as theoretical exploration "
+    "of time-symmetric scenarios, not as evidence of acausal phenomena."
+)
+
+# Placeholders echoed in the experiment details for missing fields
+_SENTINEL_UNSPEC: Final[str] = sys.intern("(not specified)")
+_SENTINEL_NONE: Final[str] = sys.intern("(none)")
+
+# Consistency scores indexed by the total input length modulo 7, normalized
+# to the 0.5-0.8 range and rounded once up front.
+_SCORE_TABLE: Final[Tuple[float, ...]] = tuple(round(0.5 + 0.35 * (i / 7.0), 2) for i in range(7))
+
+# Convergence notes are selected by bucketing the iteration count:
+# `_CONV_TEMPLATES[bisect_right(_CONV_BOUNDS, iterations)]`
+_CONV_BOUNDS: Final[Tuple[int, ...]] = (1, 100, 1000)
+_CONV_TEMPLATES: Final[Tuple[str, ...]] = (
+    "No iterations recorded; unable to assess convergence.",
+    "Simulation ran for %d iterations. Early termination detected; results may not represent full convergence.",
+    "Simulation completed %d iterations with moderate convergence characteristics.",
+    "Simulation completed %d iterations with good convergence behavior. Stable solution reached.",
+)
+_SEED_SUFFIX_FMT: Final[str] = " (Reproducible with seed=%d)"
 
 
 class ExperimentRecord(TypedDict, total=False):
@@ -33,6 +64,86 @@ class ExperimentSummary(TypedDict):
     experiment_details: dict[str, str | int]
 
 
+@dataclass(frozen=True)
+class ExperimentSummaryObj:
+    """Slotted, immutable form of an ExperimentSummary with flattened details."""
+    __slots__ = (
+        "consistency_score",
+        "convergence_notes",
+        "disclaimer",
+        "past_state",
+        "future_constraint",
+        "final_state",
+        "seed",
+        "iterations",
+        "notes",
+    )
+    
+    consistency_score: float
+    convergence_notes: str
+    disclaimer: str
+    past_state: str
+    future_constraint: str
+    final_state: str
+    seed: int
+    iterations: int
+    notes: str
+    
+    # Without a `__dict__`, pickling and copying restore state through
+    # `__setstate__`, which has to bypass the frozen `__setattr__`. This
+    # matches what `dataclass(slots=True)` generates on Python 3.10+.
+    def __getstate__(self) -> tuple[object, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: tuple[object, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
+    def as_dict(self) -> ExperimentSummary:
+        """Convert to the dict-based ExperimentSummary form."""
+        return {
+            "consistency_score": self.consistency_score,
+            "convergence_notes": self.convergence_notes,
+            "disclaimer": self.disclaimer,
+            "experiment_details": {
+                "past_state": self.past_state,
+                "future_constraint": self.future_constraint,
+                "final_state": self.final_state,
+                "seed": self.seed,
+                "iterations": self.iterations,
+                "notes": self.notes,
+            },
+        }
+
+
+# Values used for any field missing from an ExperimentRecord
+_DEFAULTS: Final[ExperimentRecord] = {
+    "past_state": "",
+    "future_constraint": "",
+    "final_state": "",
+    "seed": 0,
+    "iterations": 0,
+    "notes": "",
+}
+
+
+class _Details(NamedTuple):
+    """Echo of the input parameters, with placeholders for missing values."""
+    past_state: str
+    future_constraint: str
+    final_state: str
+    seed: int
+    iterations: int
+    notes: str
+
+
+class _CachedSummary(NamedTuple):
+    """Immutable form of an ExperimentSummary, as stored in the cache."""
+    consistency_score: float
+    convergence_notes: str
+    experiment_details: _Details
+
+
 def synthesize_temporal_summary(record: ExperimentRecord) -> ExperimentSummary:
     """
     Synthesize a structured summary from a temporal experiment record.
@@ -41,13 +152,18 @@ def synthesize_temporal_summary(record: ExperimentRecord) -> ExperimentSummary:
     past states, future constraints, final states, and experiment parameters,
     and produces a structured summary with consistency metrics.
     
+    Summaries are memoized on the record's fields, so repeated calls with the
+    same parameters are cheap; see `summary_cache_info()` for hit/miss counts.
+    
     Args:
         record: An ExperimentRecord containing:
             - past_state: Description of initial conditions
             - future_constraint: Description of target/boundary conditions
             - final_state: Description of achieved final state
-            - seed: Random seed used (for reproducibility)
-            - iterations: Number of simulation iterations
+            - seed: Random seed used (for reproducibility); only a positive
+              seed is mentioned in the convergence notes
+            - iterations: Number of simulation iterations; zero or a
+              negative count is reported as no iterations recorded
             - notes: Additional experimental notes
     
     Returns:
@@ -72,60 +188,151 @@ def synthesize_temporal_summary(record: ExperimentRecord) -> ExperimentSummary:
         0.85
     """
     # Extract parameters with defaults
-    past_state = record.get("past_state", "")
-    future_constraint = record.get("future_constraint", "")
-    final_state = record.get("final_state", "")
-    seed = record.get("seed", 0)
-    iterations = record.get("iterations", 0)
-    notes = record.get("notes", "")
+    values = _DEFAULTS | record
+    cached = _synthesize_cached(
+        values["past_state"],
+        values["future_constraint"],
+        values["final_state"],
+        values["seed"],
+        values["iterations"],
+        values["notes"],
+    )
+    
+    return _to_summary(cached)
+
+
+def synthesize_temporal_summary_batch(records: Iterable[ExperimentRecord]) -> list[ExperimentSummary]:
+    """
+    Synthesize summaries for many experiment records at once.
+    
+    Produces the same summaries as calling `synthesize_temporal_summary()` on
+    each record, sharing its cache, so repeated records are only computed once.
+    
+    Args:
+        records: The ExperimentRecords to summarize.
+    
+    Returns:
+        A list of ExperimentSummary objects, in the same order as `records`.
+    """
+    return [_to_summary(cached) for cached in _synthesize_many(records)]
+
+
+def synthesize_temporal_summary_objects(records: Iterable[ExperimentRecord]) -> list[ExperimentSummaryObj]:
+    """
+    Synthesize summaries for many experiment records as slotted objects.
     
+    Same as `synthesize_temporal_summary_batch()`, but each summary is an
+    ExperimentSummaryObj instead of a dict, which is more compact to hold and
+    iterate over in bulk. Use `ExperimentSummaryObj.as_dict()` to get the
+    ExperimentSummary form back.
+    
+    Args:
+        records: The ExperimentRecords to summarize.
+    
+    Returns:
+        A list of ExperimentSummaryObj objects, in the same order as `records`.
+    """
+    return [
+        ExperimentSummaryObj(consistency_score, convergence_notes, _DISCLAIMER, *experiment_details)
+        for consistency_score, convergence_notes, experiment_details in _synthesize_many(records)
+    ]
+
+
+def summary_cache_info() -> functools._CacheInfo:
+    """Return hit/miss statistics for the memoized summary computation."""
+    return _synthesize_cached.cache_info()
+
+
+# `functools.lru_cache` is used directly because this module has to stay
+# importable on its own, without the rest of the `perplexity` package.
+# `typed=True` keeps equal values of different types (`True` vs `1`, `1500`
+# vs `numpy.int64(1500)`) apart, since the summary echoes them back as given.
+@functools.lru_cache(maxsize=1024, typed=True)  # noqa: TID251
+def _synthesize_cached(
+    past_state: str,
+    future_constraint: str,
+    final_state: str,
+    seed: int,
+    iterations: int,
+    notes: str,
+) -> _CachedSummary:
+    """Compute the summary fields for a single set of experiment parameters.
+    
+    The result only depends on the arguments, so it is memoized and returned
+    as an immutable tuple that is safe to share between callers.
+    """
     # Compute a deterministic consistency score based on input lengths
     # This is a simple heuristic for demonstration purposes
     # In a real implementation, this would involve actual analysis
-    if past_state and future_constraint and final_state:
-        # Simple deterministic calculation based on string properties
-        len_sum = len(past_state) + len(future_constraint) + len(final_state)
-        # Normalize to 0.0-1.0 range using modulo arithmetic for determinism
-        consistency_score = round(0.5 + 0.35 * ((len_sum % 7) / 7.0), 2)
-    else:
-        consistency_score = 0.0
+    lp, lf, lfn = len(past_state), len(future_constraint), len(final_state)
+    # The score is zero unless all three states are given; multiplying by the
+    # presence mask selects that without branching.
+    mask = (lp > 0) * (lf > 0) * (lfn > 0)
+    consistency_score = _SCORE_TABLE[(lp + lf + lfn) % 7] * mask
     
+    bucket = bisect.bisect_right(_CONV_BOUNDS, iterations)
+    return _assemble(consistency_score, bucket, past_state, future_constraint, final_state, seed, iterations, notes)
+
+
+def _assemble(
+    consistency_score: float,
+    bucket: int,
+    past_state: str,
+    future_constraint: str,
+    final_state: str,
+    seed: int,
+    iterations: int,
+    notes: str,
+) -> _CachedSummary:
+    """Build the summary from a precomputed score and convergence bucket."""
     # Generate convergence notes based on iterations
-    if iterations == 0:
-        convergence_notes = "No iterations recorded; unable to assess convergence."
-    elif iterations < 100:
-        convergence_notes = f"Simulation ran for {iterations} iterations. Early termination detected; results may not represent full convergence."
-    elif iterations < 1000:
-        convergence_notes = f"Simulation completed {iterations} iterations with moderate convergence characteristics."
-    else:
-        convergence_notes = f"Simulation completed {iterations} iterations with good convergence behavior. Stable solution reached."
+    template = _CONV_TEMPLATES[bucket]
+    convergence_notes = template % iterations if bucket else template
     
     # Add seed information to convergence notes for reproducibility
-    if seed > 0:
-        convergence_notes += f" (Reproducible with seed={seed})"
-    
-    # Construct the disclaimer
-    disclaimer = (
-        "DISCLAIMER: This summary is generated from classical computational inference. "
-        "It does NOT represent physical retrocausality or actual backward time propagation. "
-        "All analysis is performed using standard forward-time simulation with post-hoc "
-        "constraint evaluation. Results should be interpreted as theoretical exploration "
-        "of time-symmetric scenarios, not as evidence of acausal phenomena."
-    )
+    convergence_notes = convergence_notes + (_SEED_SUFFIX_FMT % seed if seed > 0 else "")
     
-    # Build experiment details dictionary
-    experiment_details = {
-        "past_state": past_state or "(not specified)",
-        "future_constraint": future_constraint or "(not specified)",
-        "final_state": final_state or "(not specified)",
-        "seed": seed,
-        "iterations": iterations,
-        "notes": notes or "(none)",
-    }
+    # Build experiment details
+    experiment_details = _Details(
+        past_state or _SENTINEL_UNSPEC,
+        future_constraint or _SENTINEL_UNSPEC,
+        final_state or _SENTINEL_UNSPEC,
+        seed,
+        iterations,
+        notes or _SENTINEL_NONE,
+    )
     
-    return ExperimentSummary(
+    return _CachedSummary(
         consistency_score=consistency_score,
         convergence_notes=convergence_notes,
-        disclaimer=disclaimer,
         experiment_details=experiment_details,
     )
+
+
+def _synthesize_many(records: Iterable[ExperimentRecord]) -> list[_CachedSummary]:
+    """Compute the summary fields of every record through the memoized core."""
+    fields = [
+        (
+            values["past_state"],
+            values["future_constraint"],
+            values["final_state"],
+            values["seed"],
+            values["iterations"],
+            values["notes"],
+        )
+        for values in (_DEFAULTS | record for record in records)
+    ]
+    return [_synthesize_cached(*f) for f in fields]
+
+
+def _to_summary(cached: _CachedSummary) -> ExperimentSummary:
+    consistency_score, convergence_notes, experiment_details = cached
+    # The cached result is shared between calls, so hand each caller its own
+    # mutable copy of the details. `dict(zip(...))` skips the Python-level
+    # `_asdict()` call.
+    return {
+        "consistency_score": consistency_score,
+        "convergence_notes": convergence_notes,
+        "disclaimer": _DISCLAIMER,
+        "experiment_details": dict(zip(_Details._fields, experiment_details)),
+    }
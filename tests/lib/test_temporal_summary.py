@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import sys
+import copy
+import pickle
+import subprocess
+import dataclasses
+
+import pytest
+
+from perplexity.lib import temporal_summary
+from perplexity.lib.temporal_summary import (
+    ExperimentRecord,
+    summary_cache_info,
+    synthesize_temporal_summary,
+    synthesize_temporal_summary_batch,
+    synthesize_temporal_summary_objects,
+)
+
+RECORD: ExperimentRecord = {
+    "past_state": "quantum_system_ground_state",
+    "future_constraint": "excited_state_target_energy_5.2eV",
+    "final_state": "excited_state_achieved_energy_5.18eV",
+    "seed": 42,
+    "iterations": 1500,
+    "notes": "Standard perturbation analysis with time-symmetric boundary conditions",
+}
+
+
+def test_complete_record() -> None:
+    summary = synthesize_temporal_summary(RECORD)
+
+    assert summary["consistency_score"] == 0.75
+    assert summary["convergence_notes"] == (
+        "Simulation completed 1500 iterations with good convergence behavior. Stable solution reached."
+        " (Reproducible with seed=42)"
+    )
+    assert summary["disclaimer"].startswith("DISCLAIMER: This summary is generated from classical")
+    assert summary["experiment_details"] == dict(RECORD)
+
+
+def test_empty_record() -> None:
+    summary = synthesize_temporal_summary({})
+
+    assert summary["consistency_score"] == 0.0
+    assert summary["convergence_notes"] == "No iterations recorded; unable to assess convergence."
+    assert summary["experiment_details"] == {
+        "past_state": "(not specified)",
+        "future_constraint": "(not specified)",
+        "final_state": "(not specified)",
+        "seed": 0,
+        "iterations": 0,
+        "notes": "(none)",
+    }
+
+
+@pytest.mark.parametrize(
+    "past_state, future_constraint, final_state, expected",
+    [
+        ("a", "bb", "ccc", 0.8),
+        ("abcd", "bb", "c", 0.5),
+        ("abcd", "bb", "cc", 0.55),
+        ("a", "", "ccc", 0.0),
+    ],
+)
+def test_consistency_score(past_state: str, future_constraint: str, final_state: str, expected: float) -> None:
+    summary = synthesize_temporal_summary(
+        {"past_state": past_state, "future_constraint": future_constraint, "final_state": final_state}
+    )
+    assert summary["consistency_score"] == expected
+
+
+@pytest.mark.parametrize(
+    "iterations, expected",
+    [
+        (0, "No iterations recorded; unable to assess convergence."),
+        (
+            1,
+            "Simulation ran for 1 iterations. Early termination detected; results may not represent full convergence.",
+        ),
+        (
+            99,
+            "Simulation ran for 99 iterations. Early termination detected; results may not represent full convergence.",
+        ),
+        (100, "Simulation completed 100 iterations with moderate convergence characteristics."),
+        (999, "Simulation completed 999 iterations with moderate convergence characteristics."),
+        (
+            1000,
+            "Simulation completed 1000 iterations with good convergence behavior. Stable solution reached.",
+        ),
+    ],
+)
+def test_convergence_notes(iterations: int, expected: str) -> None:
+    summary = synthesize_temporal_summary({"iterations": iterations})
+    assert summary["convergence_notes"] == expected
+
+    summary = synthesize_temporal_summary({"iterations": iterations, "seed": 7})
+    assert summary["convergence_notes"] == expected + " (Reproducible with seed=7)"
+
+
+def test_non_positive_seed_and_iterations() -> None:
+    summary = synthesize_temporal_summary({"seed": -1, "iterations": -5})
+
+    assert summary["convergence_notes"] == "No iterations recorded; unable to assess convergence."
+    assert summary["experiment_details"]["seed"] == -1
+    assert summary["experiment_details"]["iterations"] == -5
+
+
+def test_repeated_calls_are_memoized() -> None:
+    record: ExperimentRecord = {**RECORD, "notes": "memoization check"}
+
+    first = synthesize_temporal_summary(record)
+    hits = summary_cache_info().hits
+    second = synthesize_temporal_summary(record)
+
+    assert summary_cache_info().hits == hits + 1
+    assert first == second
+
+
+def test_cache_distinguishes_equal_values_of_different_types() -> None:
+    for seed in (True, 1, True, 1):
+        echoed = synthesize_temporal_summary({"seed": seed, "notes": "typed cache"})["experiment_details"]["seed"]
+        assert type(echoed) is type(seed)
+
+
+def test_cache_distinguishes_numpy_integers() -> None:
+    np = pytest.importorskip("numpy")
+
+    for iterations in (np.int64(1500), 1500, np.int64(1500), 1500):
+        summary = synthesize_temporal_summary({"iterations": iterations, "notes": "typed cache"})
+        assert type(summary["experiment_details"]["iterations"]) is type(iterations)
+
+
+def test_details_are_not_shared_between_calls() -> None:
+    record: ExperimentRecord = {**RECORD, "notes": "mutation check"}
+
+    first = synthesize_temporal_summary(record)
+    first["experiment_details"]["notes"] = "changed"
+
+    assert synthesize_temporal_summary(record)["experiment_details"]["notes"] == "mutation check"
+
+
+BATCH: list[ExperimentRecord] = [
+    RECORD,
+    {},
+    {"past_state": "a", "future_constraint": "bb", "final_state": "ccc", "seed": 3},
+    {"past_state": "a", "final_state": "ccc", "iterations": 99, "notes": "partial"},
+    {"past_state": "initial", "future_constraint": "target", "final_state": "result", "iterations": 500},
+    {"iterations": 1},
+    {"iterations": 10**20, "seed": 5},
+    {"iterations": -(10**20)},
+]
+
+
+def test_batch_matches_single_record_path() -> None:
+    assert synthesize_temporal_summary_batch(BATCH) == [synthesize_temporal_summary(record) for record in BATCH]
+    assert synthesize_temporal_summary_batch([]) == []
+
+
+def test_batch_with_duplicate_records_uses_the_cache() -> None:
+    records = BATCH * 50
+
+    temporal_summary._synthesize_cached.cache_clear()
+    single = [synthesize_temporal_summary(record) for record in records]
+    single_hits = summary_cache_info().hits
+
+    temporal_summary._synthesize_cached.cache_clear()
+    batch = synthesize_temporal_summary_batch(records)
+    batch_hits = summary_cache_info().hits
+
+    assert batch == single
+    assert single_hits == len(records) - len(BATCH)
+    assert batch_hits >= single_hits
+
+
+def test_import_does_not_load_batch_dependencies() -> None:
+    code = "import sys, perplexity.lib.temporal_summary; assert not {'numpy', 'numba'} & set(sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_summary_objects() -> None:
+    objects = synthesize_temporal_summary_objects(BATCH)
+
+    assert [obj.as_dict() for obj in objects] == synthesize_temporal_summary_batch(BATCH)
+    assert objects[0].past_state == "quantum_system_ground_state"
+    assert not hasattr(objects[0], "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        objects[0].seed = 1  # type: ignore[misc]
+
+    for obj in objects:
+        for clone in (pickle.loads(pickle.dumps(obj)), copy.copy(obj), copy.deepcopy(obj)):
+            assert clone == obj
+            assert clone.as_dict() == obj.as_dict()